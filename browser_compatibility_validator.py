@@ -8,12 +8,15 @@ and analyzing the implementation.
 import os
 import re
 import json
+import hashlib
+import mmap
+import math
 import argparse
+from collections import Counter
+from contextlib import contextmanager
 from pathlib import Path
-import webbrowser
-import http.server
-import socketserver
-import threading
+from string import Template
+from types import MappingProxyType
 import time
 from urllib.parse import urlparse
 
@@ -24,6 +27,30 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Prefer RE2's linear-time automaton for the plain regular patterns
+try:
+    import re2 as re_engine
+except ImportError:
+    re_engine = re
+
+# selectolax 1.0 removed the Modest backend, so prefer Lexbor and only fall
+# back to selectolax.parser on older releases
+try:
+    from selectolax.lexbor import LexborHTMLParser as _HP
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _HP
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
 try:
     from bs4 import BeautifulSoup
     BS4_AVAILABLE = True
@@ -31,222 +58,549 @@ except ImportError:
     BS4_AVAILABLE = False
 
 try:
-    import matplotlib.pyplot as plt
-    import numpy as np
-    MATPLOTLIB_AVAILABLE = True
+    import lxml  # noqa: F401 - only used as a BeautifulSoup tree builder
+    _BS4_PARSER = 'lxml'
 except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+    _BS4_PARSER = 'html.parser'
+
+
+# Precompiled patterns used by the analyzers. Compiling once at import time
+# avoids a lookup in the re module's pattern cache on every call. They are
+# bytes patterns because the analyzers search the raw, undecoded file contents.
+# Flags are written inline so the patterns compile unchanged under RE2.
+_DOCTYPE_RE = re_engine.compile(rb'\s*<!DOCTYPE html>')
+_MEDIADEVICES_GUARD_RE = re_engine.compile(rb'if\s*\(\s*navigator\.mediaDevices')
+_MEDIA_QUERY_RE = re_engine.compile(rb'@media\s+[^{]+{')
+
+# Browser compatibility patterns as (feature, usage literal, usage regex,
+# detection literal, feature-detection regex). Each literal occurs in every
+# match of the regex after it, so a cheap bytes find() can rule the regex out.
+_COMPATIBILITY_PATTERNS = [
+    (feature, usage_literal, re_engine.compile(pattern),
+     detection_literal, re_engine.compile(rb'if\s*\([^)]*' + pattern.split(b'|')[0]))
+    for feature, usage_literal, pattern, detection_literal in [
+        ('getUserMedia', b'getUserMedia',
+         rb'navigator\.getUserMedia|navigator\.mediaDevices\.getUserMedia', b'navigator.getUserMedia'),
+        ('Canvas API', b'getContext', rb'getContext\s*\(\s*[\'"]2d[\'"]\s*\)', b'getContext'),
+        ('Touch Events', b'touch', rb'touchstart|touchmove|touchend', b'touchstart'),
+        ('Orientation', b'orientation', rb'orientation|window\.matchMedia\s*\(\s*[\'"]orientation', b'orientation')
+    ]
+]
+
+# CSS selectors for the parse-tree checks in analyze_html
+_VIEWPORT_SELECTOR = 'meta[name="viewport" i]'
+# Any non-empty lang counts (e.g. "en" or "en-US"); the regex fallback's
+# lang group in _HTML_MASTER_RE applies the same rule
+_HTML_LANG_SELECTOR = 'html[lang]:not([lang=""])'
+_VIDEO_WITHOUT_PLAYSINLINE_SELECTOR = 'video:not([playsinline])'
+_ARIA_LABEL_SELECTOR = '[aria-label]'
+_UNOPTIMIZED_IMG_SELECTOR = 'img:not([srcset]):not([loading])'
+_LINK_WITHOUT_ROLE_SELECTOR = 'a:not([role])'
+
+# Single-pass scanners: every token the HTML/CSS/JS analyzers care about is
+# folded into one alternation so each file is walked once and the matches are
+# tallied by group name. The prefixed transform/transition groups come first so
+# they are not also tallied as their unprefixed forms. Media queries are counted
+# separately with _MEDIA_QUERY_RE: a match runs up to the opening brace, which
+# would hide the px values in the query condition from this scanner.
+_HTML_MASTER_RE = re_engine.compile(
+    rb'(?P<viewport>(?i:<meta\s+name=["\']viewport["\']))'
+    rb'|(?P<lang>(?i:<html\s(?:[^>]*\s)?lang\s*=\s*(?:"[^"]+"|\'[^\']+\'|[^\s"\'>]+)))'
+    rb'|(?P<video><video)'
+    rb'|(?P<playsinline>playsinline)'
+    rb'|(?P<aria_label>(?i:aria-label))'
+)
+
+_CSS_MASTER_RE = re_engine.compile(
+    rb'(?P<flex>display: flex)'
+    rb'|(?P<webkit_flex>-webkit-flex)'
+    rb'|(?P<ms_flexbox>-ms-flexbox)'
+    rb'|(?P<webkit_transform>-webkit-transform:)'
+    rb'|(?P<transform>transform:)'
+    rb'|(?P<webkit_transition>-webkit-transition:)'
+    rb'|(?P<transition>transition:)'
+    rb'|(?P<animation>animation:)'
+    rb'|(?P<will_change>will-change:)'
+    rb'|(?P<px>\d+px)'
+    rb'|(?P<rel>\d+(?:em|rem|%|vh|vw))'
+)
+
+_JS_MASTER_RE = re_engine.compile(
+    rb'(?P<media_devices>navigator\.mediaDevices)'
+    rb'|(?P<try>try)'
+    rb'|(?P<catch>catch)'
+    rb'|(?P<set_interval>setInterval\()'
+    rb'|(?P<animation_frame>requestAnimationFrame)'
+    rb'|(?P<polyfill>(?i:polyfill))'
+)
+
+
+def _analysis_backend():
+    """Name the regex engine and HTML parser the analyzers will use.
+    
+    Results depend on both (the img/link checks need a parser, for example), so
+    the name is part of the cache location.
+    """
+    if SELECTOLAX_AVAILABLE:
+        html_parser = 'selectolax'
+    elif BS4_AVAILABLE:
+        html_parser = f"bs4-{_BS4_PARSER}"
+    else:
+        html_parser = 'noparser'
+    return f"{re_engine.__name__}-{html_parser}"
+
+
+def _dump_json(obj, compact=False):
+    """Encode obj as UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=0 if compact else orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# SVG chart used by visualize_results: a bar chart of findings per category
+# on the left and a pie chart of CSS unit usage on the right
+_CHART_COLORS = ('#ff9999', '#66b3ff', '#99ff99')
+_BAR_BASELINE = 520
+_BAR_AREA_HEIGHT = 420
+_PIE_CX, _PIE_CY, _PIE_R = 900, 320, 180
+
+_SVG_CHART = Template('''<svg xmlns="http://www.w3.org/2000/svg" width="1200" height="600" viewBox="0 0 1200 600" font-family="sans-serif" font-size="14">
+<rect width="1200" height="600" fill="white"/>
+<text x="300" y="40" text-anchor="middle" font-size="18">Issues by Category</text>
+<text x="40" y="310" text-anchor="middle" transform="rotate(-90 40 310)">Count</text>
+<line x1="80" y1="520" x2="560" y2="520" stroke="black"/>
+<line x1="80" y1="80" x2="80" y2="520" stroke="black"/>
+${bars}${pie}</svg>
+''')
+_SVG_BAR = Template('''<rect x="${x}" y="${y}" width="100" height="${height}" fill="${color}"/>
+<text x="${center}" y="${label_y}" text-anchor="middle">${value}</text>
+<text x="${center}" y="545" text-anchor="middle">${category}</text>
+''')
+_SVG_PIE_TITLE = '<text x="900" y="40" text-anchor="middle" font-size="18">CSS Units Distribution</text>\n'
+_SVG_PIE_SLICE = Template('''${shape}
+<text x="${pct_x}" y="${pct_y}" text-anchor="middle">${pct}</text>
+<text y="${label_y}" text-anchor="${anchor}">${label}</text>
+''')
+
+
+def _pie_slice_shape(start, sweep, color):
+    """Return the SVG element for a pie slice starting at angle start (radians)."""
+    if sweep >= 2 * math.pi - 1e-9:
+        # A full-circle arc has identical endpoints and would not be drawn
+        return f'<circle cx="{_PIE_CX}" cy="{_PIE_CY}" r="{_PIE_R}" fill="{color}"/>'
+    end = start + sweep
+    x1 = _PIE_CX + _PIE_R * math.cos(start)
+    y1 = _PIE_CY - _PIE_R * math.sin(start)
+    x2 = _PIE_CX + _PIE_R * math.cos(end)
+    y2 = _PIE_CY - _PIE_R * math.sin(end)
+    large_arc = 1 if sweep > math.pi else 0
+    return (f'<path d="M {_PIE_CX} {_PIE_CY} L {x1:.1f} {y1:.1f} '
+            f'A {_PIE_R} {_PIE_R} 0 {large_arc} 0 {x2:.1f} {y2:.1f} Z" fill="{color}"/>')
+
+
+# Files smaller than this are read into memory rather than memory-mapped
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+
+@contextmanager
+def _map_file(path, size):
+    """Yield the contents of a file for searching.
+    
+    Files of at least _MMAP_THRESHOLD bytes are memory-mapped read-only, so the
+    regex engine scans the page cache directly instead of a private copy.
+    Smaller files, which covers the simulator's own sources, are simply read
+    with read_bytes(): mapping them saves nothing measurable, and a mapped file
+    that is truncated while being scanned (e.g. by an editor saving it) kills
+    the process with SIGBUS, which no except clause can catch. Note that `in`
+    on an mmap only tests single bytes; use find() for substrings.
+    """
+    if size < _MMAP_THRESHOLD:
+        # Also covers empty files, which mmap cannot map
+        yield Path(path).read_bytes()
+        return
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield mm
 
 
 class BrowserCompatibilityValidator:
     """Validates browser compatibility for the GameBoy Color simulator."""
     
-    def __init__(self, base_dir='.'):
+    # Define browser user agents for testing
+    BROWSER_USER_AGENTS = MappingProxyType({
+        'chrome': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'firefox': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
+        'safari': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
+        'edge': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59',
+        'ipad': 'Mozilla/5.0 (iPad; CPU OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Mobile/15E148 Safari/604.1'
+    })
+    
+    # Define critical browser features to check
+    CRITICAL_FEATURES = (
+        'MediaDevices API',
+        'getUserMedia',
+        'Canvas API',
+        'Flexbox',
+        'Touch Events',
+        'requestAnimationFrame'
+    )
+    
+    # Define responsive breakpoints to check
+    RESPONSIVE_BREAKPOINTS = (
+        MappingProxyType({'name': 'mobile', 'width': 375, 'height': 667}),
+        MappingProxyType({'name': 'tablet', 'width': 768, 'height': 1024}),
+        MappingProxyType({'name': 'desktop', 'width': 1366, 'height': 768})
+    )
+    
+    # Bump whenever the checks change so results cached by older versions of
+    # the analyzers are not reused
+    _CACHE_VERSION = 5
+    
+    # Single-pass scanner for each kind of file, compiled once at import time
+    _SCANNERS = {
+        'html': _HTML_MASTER_RE,
+        'css': _CSS_MASTER_RE,
+        'js': _JS_MASTER_RE
+    }
+    
+    def __init__(self, base_dir='.', use_cache=True):
         self.base_dir = Path(base_dir)
-        self.results = {
+        self.results = self._empty_results()
+        
+        # Recommendations already in self.results, used as an ordered set so the
+        # same advice for several files is only reported once
+        self._recommendation_set = {}
+        
+        # Per-file analysis results keyed by (file_path, content digest), backed
+        # by JSON files under .cache/ so unchanged files are not re-analyzed
+        self.use_cache = use_cache
+        self.cache_dir = self.base_dir / '.cache' / f"v{self._CACHE_VERSION}" / _analysis_backend()
+        self._cache = {}
+    
+    @staticmethod
+    def _empty_results():
+        """Return an empty results structure."""
+        return {
             'file_analysis': {},
             'compatibility_issues': [],
             'responsive_design': {},
             'performance_concerns': [],
             'recommendations': []
         }
+    
+    def _merge_results(self, results):
+        """Merge the results of a single-file analysis into self.results."""
+        for key, value in results.items():
+            if key == 'recommendations':
+                for recommendation in value:
+                    self._add_recommendation(recommendation)
+            elif isinstance(value, dict):
+                self.results[key].update(value)
+            else:
+                self.results[key].extend(value)
+    
+    def _add_recommendation(self, recommendation):
+        """Record a recommendation unless it has already been made."""
+        if recommendation not in self._recommendation_set:
+            self._recommendation_set[recommendation] = None
+            self.results['recommendations'].append(recommendation)
+    
+    def _scan(self, kind, content):
+        """Tally the tokens of interest for a kind of file in a single pass."""
+        counts = Counter(m.lastgroup for m in self._SCANNERS[kind].finditer(content))
+        # RE2 reports group names of bytes patterns as bytes; key by str for both engines
+        return Counter({
+            (name.decode('ascii') if isinstance(name, bytes) else name): count
+            for name, count in counts.items()
+        })
+    
+    def _cache_path(self, file_path, digest):
+        """Return the on-disk location of a cached analysis.
         
-        # Define browser user agents for testing
-        self.browser_user_agents = {
-            'chrome': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'firefox': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
-            'safari': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
-            'edge': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59',
-            'ipad': 'Mozilla/5.0 (iPad; CPU OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Mobile/15E148 Safari/604.1'
-        }
+        The name is built from hashes only, so absolute paths or '..' in
+        file_path cannot place the entry outside cache_dir.
+        """
+        path_digest = hashlib.blake2b(os.fsencode(file_path), digest_size=16).hexdigest()
+        return self.cache_dir / f"{path_digest}.{digest.hex()}.json"
+    
+    def _load_cached(self, file_path, content):
+        """Return (digest, cached results) for file contents; results is None on a miss."""
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        if not self.use_cache:
+            return digest, None
         
-        # Define critical browser features to check
-        self.critical_features = [
-            'MediaDevices API',
-            'getUserMedia',
-            'Canvas API',
-            'Flexbox',
-            'Touch Events',
-            'requestAnimationFrame'
-        ]
+        key = (file_path, digest)
+        if key not in self._cache:
+            # The cache lives inside the analyzed directory, which may not be
+            # trusted, so it holds plain JSON and anything malformed is a miss
+            try:
+                cached = json.loads(self._cache_path(file_path, digest).read_bytes())
+            except (OSError, ValueError):
+                return digest, None
+            if not self._is_valid_results(cached):
+                return digest, None
+            self._cache[key] = cached
+        return digest, self._cache[key]
+    
+    @staticmethod
+    def _is_valid_results(results):
+        """Check that a loaded cache entry has the exact shape of a results dict."""
+        if not isinstance(results, dict) or results.keys() != BrowserCompatibilityValidator._empty_results().keys():
+            return False
+        for key in ('compatibility_issues', 'performance_concerns', 'recommendations'):
+            if not isinstance(results[key], list) or not all(isinstance(item, str) for item in results[key]):
+                return False
+        responsive_design = results['responsive_design']
+        if not isinstance(responsive_design, dict) or not all(
+                isinstance(value, int) and not isinstance(value, bool)
+                for value in responsive_design.values()):
+            return False
+        file_analysis = results['file_analysis']
+        return isinstance(file_analysis, dict) and all(
+            isinstance(analysis, dict) and
+            all(isinstance(value, (str, int, bool)) for value in analysis.values())
+            for analysis in file_analysis.values()
+        )
+    
+    def _store_cached(self, file_path, digest, results):
+        """Remember the results of a successful analysis."""
+        if not self.use_cache:
+            return
         
-        # Define responsive breakpoints to check
-        self.responsive_breakpoints = [
-            {'name': 'mobile', 'width': 375, 'height': 667},
-            {'name': 'tablet', 'width': 768, 'height': 1024},
-            {'name': 'desktop', 'width': 1366, 'height': 768}
-        ]
+        self._cache[(file_path, digest)] = results
+        cache_path = self._cache_path(file_path, digest)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(_dump_json(results, compact=True))
+        except OSError:
+            # The cache is only an optimization; keep the in-memory entry
+            pass
     
     def analyze_html(self, file_path='index.html'):
         """Analyze HTML file for compatibility issues."""
+        success, results = self._analyze_html(file_path)
+        self._merge_results(results)
+        return success
+    
+    def _analyze_html(self, file_path):
+        """Run the HTML checks, returning (success, results) for this file only."""
+        results = self._empty_results()
         try:
             html_path = self.base_dir / file_path
-            if not html_path.exists():
-                self.results['compatibility_issues'].append(f"HTML file not found: {file_path}")
-                return False
-            
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Check for viewport meta tag
-            if not re.search(r'<meta\s+name=["\']viewport["\']', html_content, re.IGNORECASE):
-                self.results['compatibility_issues'].append("Missing viewport meta tag for responsive design")
-            
-            # Check for HTML5 doctype
-            if not html_content.strip().startswith('<!DOCTYPE html>'):
-                self.results['compatibility_issues'].append("Missing HTML5 doctype declaration")
-            
-            # Check for language attribute
-            if not re.search(r'<html\s+[^>]*lang=["\'][a-z]{2}["\']', html_content, re.IGNORECASE):
-                self.results['compatibility_issues'].append("Missing language attribute on html element")
-            
-            # Check for playsinline attribute on video (iOS compatibility)
-            if '<video' in html_content and 'playsinline' not in html_content:
-                self.results['compatibility_issues'].append("Missing 'playsinline' attribute on video element for iOS compatibility")
-            
-            # Check for accessibility attributes
-            if not re.search(r'aria-label', html_content, re.IGNORECASE):
-                self.results['recommendations'].append("Consider adding ARIA labels for better accessibility")
+            try:
+                st = os.stat(html_path)
+            except FileNotFoundError:
+                results['compatibility_issues'].append(f"HTML file not found: {file_path}")
+                return False, results
             
-            # Parse with BeautifulSoup if available
-            if BS4_AVAILABLE:
-                soup = BeautifulSoup(html_content, 'html.parser')
+            with _map_file(html_path, st.st_size) as html_content:
+                digest, cached = self._load_cached(file_path, html_content)
+                if cached is not None:
+                    return True, cached
+                
+                # Parse with selectolax if available, falling back to BeautifulSoup,
+                # and answer every check from the parse tree. Each check is a
+                # single selector query that stops at the first match. Without a
+                # parser, fall back to scanning the raw markup.
+                if SELECTOLAX_AVAILABLE:
+                    find = _HP(bytes(html_content)).css_first
+                elif BS4_AVAILABLE:
+                    find = BeautifulSoup(bytes(html_content), _BS4_PARSER).select_one
+                else:
+                    find = None
+                
+                if find is not None:
+                    has_viewport = find(_VIEWPORT_SELECTOR) is not None
+                    has_lang = find(_HTML_LANG_SELECTOR) is not None
+                    video_without_playsinline = find(_VIDEO_WITHOUT_PLAYSINLINE_SELECTOR) is not None
+                    has_aria_label = find(_ARIA_LABEL_SELECTOR) is not None
+                    unoptimized_image = find(_UNOPTIMIZED_IMG_SELECTOR)
+                    link_without_role = find(_LINK_WITHOUT_ROLE_SELECTOR)
+                else:
+                    counts = self._scan('html', html_content)
+                    has_viewport = bool(counts['viewport'])
+                    has_lang = bool(counts['lang'])
+                    video_without_playsinline = bool(counts['video'] and not counts['playsinline'])
+                    has_aria_label = bool(counts['aria_label'])
+                    unoptimized_image = link_without_role = None
+                
+                # Check for viewport meta tag
+                if not has_viewport:
+                    results['compatibility_issues'].append("Missing viewport meta tag for responsive design")
+                
+                # Check for HTML5 doctype
+                if not _DOCTYPE_RE.match(html_content):
+                    results['compatibility_issues'].append("Missing HTML5 doctype declaration")
+                
+                # Check for language attribute
+                if not has_lang:
+                    results['compatibility_issues'].append("Missing language attribute on html element")
+                
+                # Check for playsinline attribute on video (iOS compatibility)
+                if video_without_playsinline:
+                    results['compatibility_issues'].append("Missing 'playsinline' attribute on video element for iOS compatibility")
+                
+                # Check for accessibility attributes
+                if not has_aria_label:
+                    results['recommendations'].append("Consider adding ARIA labels for better accessibility")
                 
                 # Check for responsive images
-                images = soup.find_all('img')
-                for img in images:
-                    if not img.get('srcset') and not img.get('loading'):
-                        self.results['recommendations'].append("Consider adding 'srcset' or 'loading' attributes to images for better performance")
-                        break
+                if unoptimized_image is not None:
+                    results['recommendations'].append("Consider adding 'srcset' or 'loading' attributes to images for better performance")
                 
                 # Check for proper button elements
-                buttons = soup.find_all(['button', 'a'])
-                for button in buttons:
-                    if button.name == 'a' and not button.get('role'):
-                        self.results['recommendations'].append("Links used as buttons should have role='button' attribute")
-                        break
-            
-            self.results['file_analysis']['html'] = {
-                'file': file_path,
-                'size': os.path.getsize(html_path),
-                'issues_count': len([i for i in self.results['compatibility_issues'] if file_path in i])
-            }
-            
-            return True
+                if link_without_role is not None:
+                    results['recommendations'].append("Links used as buttons should have role='button' attribute")
+                
+                results['file_analysis']['html'] = {
+                    'file': file_path,
+                    'size': st.st_size,
+                    'issues_count': len(results['compatibility_issues'])
+                }
+                
+                self._store_cached(file_path, digest, results)
+                return True, results
         except Exception as e:
-            self.results['compatibility_issues'].append(f"Error analyzing HTML: {str(e)}")
-            return False
+            results['compatibility_issues'].append(f"Error analyzing HTML: {str(e)}")
+            return False, results
     
     def analyze_css(self, file_path='styles.css'):
         """Analyze CSS file for compatibility issues."""
+        success, results = self._analyze_css(file_path)
+        self._merge_results(results)
+        return success
+    
+    def _analyze_css(self, file_path):
+        """Run the CSS checks, returning (success, results) for this file only."""
+        results = self._empty_results()
         try:
             css_path = self.base_dir / file_path
-            if not css_path.exists():
-                self.results['compatibility_issues'].append(f"CSS file not found: {file_path}")
-                return False
-            
-            with open(css_path, 'r', encoding='utf-8') as f:
-                css_content = f.read()
-            
-            # Check for media queries
-            media_queries = re.findall(r'@media\s+[^{]+{', css_content)
-            if not media_queries:
-                self.results['compatibility_issues'].append("No media queries found for responsive design")
-            else:
-                self.results['responsive_design']['media_queries'] = len(media_queries)
-            
-            # Check for flexbox usage
-            if 'display: flex' in css_content:
-                # Check for flexbox prefixes
-                if '-webkit-flex' not in css_content and '-ms-flexbox' not in css_content:
-                    self.results['recommendations'].append("Consider adding vendor prefixes for flexbox for better compatibility")
-            
-            # Check for vendor prefixes in transforms and transitions
-            if ('transform:' in css_content and '-webkit-transform:' not in css_content) or \
-               ('transition:' in css_content and '-webkit-transition:' not in css_content):
-                self.results['recommendations'].append("Consider adding vendor prefixes for transforms/transitions")
-            
-            # Check for animation performance
-            if 'animation:' in css_content or 'transition:' in css_content:
-                if 'will-change:' not in css_content:
-                    self.results['recommendations'].append("Consider using 'will-change' property for animation performance")
-            
-            # Check for responsive units
-            fixed_units = len(re.findall(r'\d+px', css_content))
-            responsive_units = len(re.findall(r'\d+(?:em|rem|%|vh|vw)', css_content))
-            
-            if fixed_units > responsive_units:
-                self.results['recommendations'].append("Consider using more responsive units (em, rem, %, vh, vw) instead of fixed pixels")
-            
-            self.results['responsive_design']['fixed_units'] = fixed_units
-            self.results['responsive_design']['responsive_units'] = responsive_units
-            
-            self.results['file_analysis']['css'] = {
-                'file': file_path,
-                'size': os.path.getsize(css_path),
-                'media_queries': len(media_queries),
-                'fixed_vs_responsive_ratio': f"{fixed_units}:{responsive_units}"
-            }
+            try:
+                st = os.stat(css_path)
+            except FileNotFoundError:
+                results['compatibility_issues'].append(f"CSS file not found: {file_path}")
+                return False, results
             
-            return True
+            with _map_file(css_path, st.st_size) as css_content:
+                digest, cached = self._load_cached(file_path, css_content)
+                if cached is not None:
+                    return True, cached
+                
+                # Tally every token of interest in a single pass
+                counts = self._scan('css', css_content)
+                
+                # Check for media queries
+                media_queries = 0
+                if css_content.find(b'@media') != -1:
+                    media_queries = sum(1 for _ in _MEDIA_QUERY_RE.finditer(css_content))
+                if not media_queries:
+                    results['compatibility_issues'].append("No media queries found for responsive design")
+                else:
+                    results['responsive_design']['media_queries'] = media_queries
+                
+                # Check for flexbox usage
+                if counts['flex']:
+                    # Check for flexbox prefixes
+                    if not counts['webkit_flex'] and not counts['ms_flexbox']:
+                        results['recommendations'].append("Consider adding vendor prefixes for flexbox for better compatibility")
+                
+                # Check for vendor prefixes in transforms and transitions
+                if (counts['transform'] and not counts['webkit_transform']) or \
+                   (counts['transition'] and not counts['webkit_transition']):
+                    results['recommendations'].append("Consider adding vendor prefixes for transforms/transitions")
+                
+                # Check for animation performance
+                if counts['animation'] or counts['transition'] or counts['webkit_transition']:
+                    if not counts['will_change']:
+                        results['recommendations'].append("Consider using 'will-change' property for animation performance")
+                
+                # Check for responsive units
+                fixed_units = counts['px']
+                responsive_units = counts['rel']
+                
+                if fixed_units > responsive_units:
+                    results['recommendations'].append("Consider using more responsive units (em, rem, %, vh, vw) instead of fixed pixels")
+                
+                results['responsive_design']['fixed_units'] = fixed_units
+                results['responsive_design']['responsive_units'] = responsive_units
+                
+                results['file_analysis']['css'] = {
+                    'file': file_path,
+                    'size': st.st_size,
+                    'media_queries': media_queries,
+                    'fixed_vs_responsive_ratio': f"{fixed_units}:{responsive_units}"
+                }
+                
+                self._store_cached(file_path, digest, results)
+                return True, results
         except Exception as e:
-            self.results['compatibility_issues'].append(f"Error analyzing CSS: {str(e)}")
-            return False
+            results['compatibility_issues'].append(f"Error analyzing CSS: {str(e)}")
+            return False, results
     
     def analyze_js(self, file_path='script.js'):
         """Analyze JavaScript file for compatibility issues."""
+        success, results = self._analyze_js(file_path)
+        self._merge_results(results)
+        return success
+    
+    def _analyze_js(self, file_path):
+        """Run the JavaScript checks, returning (success, results) for this file only."""
+        results = self._empty_results()
         try:
             js_path = self.base_dir / file_path
-            if not js_path.exists():
-                self.results['compatibility_issues'].append(f"JavaScript file not found: {file_path}")
-                return False
-            
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
-            
-            # Check for feature detection
-            if 'navigator.mediaDevices' in js_content:
-                if not re.search(r'if\s*\(\s*navigator\.mediaDevices', js_content):
-                    self.results['compatibility_issues'].append("Missing feature detection for MediaDevices API")
-            
-            # Check for error handling
-            if 'try' not in js_content or 'catch' not in js_content:
-                self.results['compatibility_issues'].append("Missing try/catch blocks for error handling")
-            
-            # Check for performance concerns
-            if 'setInterval(' in js_content and 'requestAnimationFrame' not in js_content:
-                self.results['performance_concerns'].append("Consider using requestAnimationFrame instead of setInterval for animations")
-            
-            # Check for browser compatibility patterns
-            compatibility_patterns = [
-                ('getUserMedia', r'navigator\.getUserMedia|navigator\.mediaDevices\.getUserMedia'),
-                ('Canvas API', r'getContext\s*\(\s*[\'"]2d[\'"]\s*\)'),
-                ('Touch Events', r'touchstart|touchmove|touchend'),
-                ('Orientation', r'orientation|window\.matchMedia\s*\(\s*[\'"]orientation')
-            ]
-            
-            for feature, pattern in compatibility_patterns:
-                if re.search(pattern, js_content):
-                    # Check if there's feature detection for this feature
-                    if not re.search(r'if\s*\([^)]*' + pattern.split('|')[0], js_content):
-                        self.results['recommendations'].append(f"Consider adding feature detection for {feature}")
-            
-            # Check for polyfills
-            if 'polyfill' not in js_content.lower():
-                self.results['recommendations'].append("Consider adding polyfills for broader browser support")
-            
-            self.results['file_analysis']['js'] = {
-                'file': file_path,
-                'size': os.path.getsize(js_path),
-                'has_feature_detection': 'if (navigator.mediaDevices' in js_content,
-                'has_error_handling': 'try' in js_content and 'catch' in js_content,
-                'uses_animation_frame': 'requestAnimationFrame' in js_content
-            }
+            try:
+                st = os.stat(js_path)
+            except FileNotFoundError:
+                results['compatibility_issues'].append(f"JavaScript file not found: {file_path}")
+                return False, results
             
-            return True
+            with _map_file(js_path, st.st_size) as js_content:
+                digest, cached = self._load_cached(file_path, js_content)
+                if cached is not None:
+                    return True, cached
+                
+                # Tally every token of interest in a single pass
+                counts = self._scan('js', js_content)
+                has_error_handling = bool(counts['try'] and counts['catch'])
+                
+                # Check for feature detection
+                if counts['media_devices']:
+                    if not _MEDIADEVICES_GUARD_RE.search(js_content):
+                        results['compatibility_issues'].append("Missing feature detection for MediaDevices API")
+                
+                # Check for error handling
+                if not has_error_handling:
+                    results['compatibility_issues'].append("Missing try/catch blocks for error handling")
+                
+                # Check for performance concerns
+                if counts['set_interval'] and not counts['animation_frame']:
+                    results['performance_concerns'].append("Consider using requestAnimationFrame instead of setInterval for animations")
+                
+                # Check for browser compatibility patterns
+                for feature, usage_literal, usage_re, detection_literal, detection_re in _COMPATIBILITY_PATTERNS:
+                    if js_content.find(usage_literal) != -1 and usage_re.search(js_content):
+                        # Check if there's feature detection for this feature
+                        if js_content.find(detection_literal) == -1 or not detection_re.search(js_content):
+                            results['recommendations'].append(f"Consider adding feature detection for {feature}")
+                
+                # Check for polyfills
+                if not counts['polyfill']:
+                    results['recommendations'].append("Consider adding polyfills for broader browser support")
+                
+                results['file_analysis']['js'] = {
+                    'file': file_path,
+                    'size': st.st_size,
+                    'has_feature_detection': js_content.find(b'if (navigator.mediaDevices') != -1,
+                    'has_error_handling': has_error_handling,
+                    'uses_animation_frame': bool(counts['animation_frame'])
+                }
+                
+                self._store_cached(file_path, digest, results)
+                return True, results
         except Exception as e:
-            self.results['compatibility_issues'].append(f"Error analyzing JavaScript: {str(e)}")
-            return False
+            results['compatibility_issues'].append(f"Error analyzing JavaScript: {str(e)}")
+            return False, results
     
     def generate_compatibility_report(self):
         """Generate a comprehensive compatibility report."""
@@ -275,20 +629,98 @@ class BrowserCompatibilityValidator:
         
         return report
     
-    def save_report(self, output_file='compatibility_report.json'):
-        """Save the compatibility report to a file."""
+    def save_report(self, output_file='compatibility_report.json', compact=False):
+        """Save the compatibility report to a file.
+        
+        With compact=True the JSON is written without indentation or padding,
+        which is quicker to encode and smaller for CI artifacts.
+        """
         report = self.generate_compatibility_report()
         
         output_path = self.base_dir / output_file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2)
+        output_path.write_bytes(_dump_json(report, compact))
         
         print(f"Report saved to {output_path}")
         return output_path
     
-    def visualize_results(self, output_file='compatibility_visualization.png'):
-        """Create a visualization of the compatibility results."""
-        if not MATPLOTLIB_AVAILABLE:
+    def visualize_results(self, output_file=None, heavy=False):
+        """Create a visualization of the compatibility results.
+        
+        By default the charts are written as a standalone SVG. Pass heavy=True
+        to render them with matplotlib instead.
+        """
+        if heavy:
+            return self._visualize_with_matplotlib(output_file)
+        
+        # Plot 1: Issues by category
+        categories = ['Compatibility', 'Performance', 'Recommendations']
+        values = [
+            len(self.results['compatibility_issues']),
+            len(self.results['performance_concerns']),
+            len(self.results['recommendations'])
+        ]
+        
+        max_value = max(values) or 1
+        bars = []
+        for i, (category, value, color) in enumerate(zip(categories, values, _CHART_COLORS)):
+            height = value / max_value * _BAR_AREA_HEIGHT
+            bars.append(_SVG_BAR.substitute(
+                x=f"{100 + i * 160:.1f}",
+                y=f"{_BAR_BASELINE - height:.1f}",
+                height=f"{height:.1f}",
+                center=f"{150 + i * 160:.1f}",
+                label_y=f"{_BAR_BASELINE - height - 8:.1f}",
+                color=color,
+                value=value,
+                category=category
+            ))
+        
+        # Plot 2: Responsive Design Units
+        slices = []
+        if 'fixed_units' in self.results['responsive_design'] and 'responsive_units' in self.results['responsive_design']:
+            labels = ['Fixed Units (px)', 'Responsive Units\n(em, rem, %, vh, vw)']
+            sizes = [
+                self.results['responsive_design']['fixed_units'],
+                self.results['responsive_design']['responsive_units']
+            ]
+            total = sum(sizes)
+            
+            # Slices run counterclockwise from 12 o'clock, like matplotlib's startangle=90
+            start = math.pi / 2
+            for label, size, color in zip(labels, sizes, _CHART_COLORS):
+                if not size:
+                    continue
+                sweep = 2 * math.pi * size / total
+                middle = start + sweep / 2
+                label_x = f"{_PIE_CX + 1.1 * _PIE_R * math.cos(middle):.1f}"
+                slices.append(_SVG_PIE_SLICE.substitute(
+                    shape=_pie_slice_shape(start, sweep, color),
+                    pct_x=f"{_PIE_CX + 0.6 * _PIE_R * math.cos(middle):.1f}",
+                    pct_y=f"{_PIE_CY - 0.6 * _PIE_R * math.sin(middle):.1f}",
+                    pct=f"{100 * size / total:1.1f}%",
+                    label_y=f"{_PIE_CY - 1.1 * _PIE_R * math.sin(middle):.1f}",
+                    anchor='start' if math.cos(middle) >= 0 else 'end',
+                    label=''.join(
+                        f'<tspan x="{label_x}" dy="{0 if i == 0 else 1.2}em">{line}</tspan>'
+                        for i, line in enumerate(label.split('\n'))
+                    )
+                ))
+                start += sweep
+            if slices:
+                slices.insert(0, _SVG_PIE_TITLE)
+        
+        output_path = self.base_dir / Path(output_file or 'compatibility_visualization.svg').with_suffix('.svg')
+        output_path.write_text(_SVG_CHART.substitute(bars=''.join(bars), pie=''.join(slices)), encoding='utf-8')
+        
+        print(f"Visualization saved to {output_path}")
+        return output_path
+    
+    def _visualize_with_matplotlib(self, output_file=None):
+        """Render the visualization with matplotlib."""
+        # Imported here so runs that never plot don't pay for loading matplotlib
+        try:
+            import matplotlib.pyplot as plt
+        except ImportError:
             print("Matplotlib not available. Skipping visualization.")
             return None
         
@@ -322,7 +754,7 @@ class BrowserCompatibilityValidator:
         plt.tight_layout()
         
         # Save figure
-        output_path = self.base_dir / output_file
+        output_path = self.base_dir / (output_file or 'compatibility_visualization.png')
         plt.savefig(output_path)
         plt.close()
         
@@ -331,14 +763,52 @@ class BrowserCompatibilityValidator:
     
     def start_test_server(self, port=8000):
         """Start a local server for testing."""
-        handler = http.server.SimpleHTTPRequestHandler
+        import http.server
+        import socket
+        import threading
+        
+        class TestHTTPServer(http.server.ThreadingHTTPServer):
+            # Let a browser's burst of parallel connections queue up
+            # instead of being refused
+            request_queue_size = 128
+        
+        class SendfileRequestHandler(http.server.SimpleHTTPRequestHandler):
+            def setup(self):
+                super().setup()
+                # Send small responses right away rather than waiting on Nagle
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            
+            def copyfile(self, source, outputfile):
+                # Hand static files to the kernel with sendfile() instead of
+                # copying them through user space chunk by chunk
+                try:
+                    in_fd = source.fileno()
+                    out_fd = outputfile.fileno()
+                except (AttributeError, OSError, ValueError):
+                    return super().copyfile(source, outputfile)
+                if not hasattr(os, 'sendfile'):
+                    return super().copyfile(source, outputfile)
+                
+                outputfile.flush()
+                offset = source.tell()
+                remaining = os.fstat(in_fd).st_size - offset
+                while remaining > 0:
+                    sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+        
+        handler = SendfileRequestHandler
         
         class TestServerThread(threading.Thread):
             def __init__(self, port):
                 threading.Thread.__init__(self)
                 self.port = port
                 self.daemon = True
-                self.server = socketserver.TCPServer(("", port), handler)
+                # Serve each request on its own thread so a browser's parallel
+                # asset requests are not queued behind one another
+                self.server = TestHTTPServer(("", port), handler)
             
             def run(self):
                 print(f"Starting test server at http://localhost:{self.port}")
@@ -354,6 +824,8 @@ class BrowserCompatibilityValidator:
     
     def open_in_browsers(self, url="http://localhost:8000/enhanced_index.html"):
         """Open the application in multiple browsers for testing."""
+        import webbrowser
+        
         # Check if URL is valid
         parsed_url = urlparse(url)
         if not parsed_url.scheme or not parsed_url.netloc:
@@ -382,27 +854,34 @@ class BrowserCompatibilityValidator:
         
         return opened_count > 0
     
-    def run_full_analysis(self):
+    def run_full_analysis(self, compact_report=False, heavy_viz=False):
         """Run a full analysis of all files."""
-        print("Starting GameBoy Color Simulator compatibility analysis...")
-        
-        # Analyze HTML files
-        self.analyze_html('index.html')
-        self.analyze_html('enhanced_index.html')
+        from concurrent.futures import ThreadPoolExecutor
         
-        # Analyze CSS files
-        self.analyze_css('styles.css')
-        self.analyze_css('enhanced_styles.css')
+        print("Starting GameBoy Color Simulator compatibility analysis...")
         
-        # Analyze JS files
-        self.analyze_js('script.js')
-        self.analyze_js('enhanced_script.js')
+        # Analyze HTML, CSS and JS files concurrently. Each analysis works on
+        # its own results dict; they are merged here in submission order so the
+        # report matches a sequential run.
+        analyses = [
+            (self._analyze_html, 'index.html'),
+            (self._analyze_html, 'enhanced_index.html'),
+            (self._analyze_css, 'styles.css'),
+            (self._analyze_css, 'enhanced_styles.css'),
+            (self._analyze_js, 'script.js'),
+            (self._analyze_js, 'enhanced_script.js')
+        ]
+        with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+            futures = [executor.submit(analyze, file_path) for analyze, file_path in analyses]
+            for future in futures:
+                _, results = future.result()
+                self._merge_results(results)
         
         # Generate and save report
-        report_path = self.save_report()
+        report_path = self.save_report(compact=compact_report)
         
         # Create visualization
-        viz_path = self.visualize_results()
+        viz_path = self.visualize_results(heavy=heavy_viz)
         
         print("\nAnalysis complete!")
         print(f"Found {len(self.results['compatibility_issues'])} compatibility issues")
@@ -418,9 +897,12 @@ def main():
     parser.add_argument('--server', action='store_true', help='Start a test server')
     parser.add_argument('--port', type=int, default=8000, help='Port for the test server')
     parser.add_argument('--open-browsers', action='store_true', help='Open the application in available browsers')
+    parser.add_argument('--compact-report', action='store_true', help='Write the JSON report without indentation (e.g. for CI)')
+    parser.add_argument('--heavy-viz', action='store_true', help='Render the visualization with matplotlib instead of SVG')
+    parser.add_argument('--no-cache', action='store_true', help='Re-analyze every file instead of reusing cached results')
     args = parser.parse_args()
     
-    validator = BrowserCompatibilityValidator(args.dir)
+    validator = BrowserCompatibilityValidator(args.dir, use_cache=not args.no_cache)
     
     if args.server:
         server = validator.start_test_server(args.port)
@@ -436,7 +918,7 @@ def main():
             print("Stopping server...")
             server.stop()
     else:
-        validator.run_full_analysis()
+        validator.run_full_analysis(compact_report=args.compact_report, heavy_viz=args.heavy_viz)
 
 
 if __name__ == "__main__":
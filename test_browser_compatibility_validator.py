@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass scanners in browser_compatibility_validator.py.
+Run with: python -m unittest test_browser_compatibility_validator
+"""
+
+import json
+import re
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import browser_compatibility_validator as bcv
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+SAMPLES = {
+    'html': (
+        b'<!DOCTYPE html><html lang="en"><head><meta name="viewport" content="x"></head>'
+        b'<body><video playsinline></video><button aria-label="Snap"></button></body></html>',
+        {'viewport': 1, 'lang': 1, 'video': 1, 'playsinline': 1, 'aria_label': 1}
+    ),
+    'css': (
+        b'@media (max-width: 768px) { .a { display: flex; width: 10px; } }'
+        b'.b { -webkit-transform: none; transform: none; margin: 1.5em; }',
+        {'flex': 1, 'px': 2, 'webkit_transform': 1, 'transform': 1, 'rel': 1}
+    ),
+    'js': (
+        b'if (navigator.mediaDevices) { try { run(); } catch (e) {} }'
+        b' requestAnimationFrame(draw); // Polyfill',
+        {'media_devices': 1, 'try': 1, 'catch': 1, 'animation_frame': 1, 'polyfill': 1}
+    ),
+}
+
+
+class ScannerEngineTests(unittest.TestCase):
+    """The scanners must tally by str group name under both re and RE2."""
+
+    def check_engine(self, engine):
+        validator = bcv.BrowserCompatibilityValidator(use_cache=False)
+        for kind, (content, expected) in SAMPLES.items():
+            scanner = bcv.BrowserCompatibilityValidator._SCANNERS[kind]
+            scanners = dict(bcv.BrowserCompatibilityValidator._SCANNERS)
+            scanners[kind] = engine.compile(scanner.pattern)
+            with self.subTest(engine=engine.__name__, kind=kind), \
+                    mock.patch.object(bcv.BrowserCompatibilityValidator, '_SCANNERS', scanners):
+                counts = validator._scan(kind, content)
+                self.assertTrue(all(isinstance(name, str) for name in counts))
+                for name, count in expected.items():
+                    self.assertEqual(counts[name], count, name)
+
+    def test_re_engine(self):
+        self.check_engine(re)
+
+    @unittest.skipIf(re2 is None, "google-re2 not installed")
+    def test_re2_engine(self):
+        self.check_engine(re2)
+
+
+class MediaQueryCountTests(unittest.TestCase):
+    """A media query runs from '@media' to its opening brace."""
+
+    def test_mention_without_brace_is_not_a_separate_query(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            Path(base_dir, 'styles.css').write_bytes(
+                b'/* @media overrides */\n'
+                b'@media (max-width: 10px) { .a { width: 2px; } }'
+            )
+            validator = bcv.BrowserCompatibilityValidator(base_dir, use_cache=False)
+            self.assertTrue(validator.analyze_css('styles.css'))
+            self.assertEqual(validator.results['responsive_design']['media_queries'], 1)
+            self.assertEqual(validator.results['responsive_design']['fixed_units'], 2)
+
+
+class HtmlBackendTests(unittest.TestCase):
+    """The HTML checks must agree whichever parser (if any) is installed."""
+
+    def backends(self):
+        yield 'regex', False, False
+        if bcv.SELECTOLAX_AVAILABLE:
+            yield 'selectolax', True, False
+        if bcv.BS4_AVAILABLE:
+            yield 'bs4', False, True
+
+    def issues_for(self, html):
+        with tempfile.TemporaryDirectory() as base_dir:
+            Path(base_dir, 'index.html').write_bytes(html)
+            for name, selectolax, bs4 in self.backends():
+                with self.subTest(backend=name), \
+                        mock.patch.object(bcv, 'SELECTOLAX_AVAILABLE', selectolax), \
+                        mock.patch.object(bcv, 'BS4_AVAILABLE', bs4):
+                    validator = bcv.BrowserCompatibilityValidator(base_dir, use_cache=False)
+                    self.assertTrue(validator.analyze_html('index.html'))
+                    yield validator.results['compatibility_issues']
+
+    def test_upper_case_viewport_tag(self):
+        html = b'<!DOCTYPE html><html lang="en"><head><META NAME="VIEWPORT" content="x"></head></html>'
+        for issues in self.issues_for(html):
+            self.assertNotIn("Missing viewport meta tag for responsive design", issues)
+
+
+    def test_any_non_empty_lang_attribute(self):
+        missing = "Missing language attribute on html element"
+        for lang, expect_issue in [(b'lang="en"', False), (b'lang="en-US"', False),
+                                   (b"lang='x'", False), (b'lang=fr', False),
+                                   (b'lang=""', True), (b'data-lang="en"', True)]:
+            html = b'<!DOCTYPE html><html ' + lang + b'><head></head></html>'
+            for issues in self.issues_for(html):
+                self.assertEqual(missing in issues, expect_issue, lang)
+
+
+class CacheTests(unittest.TestCase):
+    """Cached analyses stay under the cache directory and are validated on load."""
+
+    def test_entries_stay_inside_cache_dir(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            source = Path(base_dir, 'site', 'index.html')
+            source.parent.mkdir()
+            source.write_bytes(b'<!DOCTYPE html><html lang="en"></html>')
+            validator = bcv.BrowserCompatibilityValidator(Path(base_dir, 'site'))
+            for file_path in (str(source), '../site/index.html', 'index.html'):
+                with self.subTest(file_path=file_path):
+                    self.assertTrue(validator.analyze_html(file_path))
+            cache_dir = validator.cache_dir.resolve()
+            written = [p for p in Path(base_dir).rglob('*.json')]
+            self.assertEqual(len(written), 3)
+            for path in written:
+                self.assertEqual(path.resolve().parent, cache_dir)
+
+
+    def test_malformed_entries_are_misses(self):
+        content = b'<!DOCTYPE html><html lang="en"></html>'
+        malformed = [
+            {'file_analysis': {}, 'compatibility_issues': 5, 'responsive_design': {},
+             'performance_concerns': [], 'recommendations': []},
+            {'file_analysis': {}, 'compatibility_issues': [], 'responsive_design': {},
+             'performance_concerns': [], 'recommendations': [['not', 'a', 'string']]},
+            {'file_analysis': {}, 'compatibility_issues': [], 'responsive_design': {'fixed_units': 'x'},
+             'performance_concerns': [], 'recommendations': []},
+            {'file_analysis': {'html': 3}, 'compatibility_issues': [], 'responsive_design': {},
+             'performance_concerns': [], 'recommendations': []},
+        ]
+        with tempfile.TemporaryDirectory() as base_dir:
+            Path(base_dir, 'index.html').write_bytes(content)
+            for entry in malformed:
+                with self.subTest(entry=entry):
+                    validator = bcv.BrowserCompatibilityValidator(base_dir)
+                    digest, _ = validator._load_cached('index.html', content)
+                    cache_path = validator._cache_path('index.html', digest)
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_text(json.dumps(entry))
+                    self.assertTrue(validator.analyze_html('index.html'))
+                    self.assertEqual(validator.results['file_analysis']['html']['file'], 'index.html')
+
+
+class ReportTests(unittest.TestCase):
+    """The report summary must follow self.results, however it is changed."""
+
+    def test_summary_tracks_direct_mutation(self):
+        validator = bcv.BrowserCompatibilityValidator(use_cache=False)
+        validator.results['compatibility_issues'].append('first')
+        self.assertEqual(validator.generate_compatibility_report()['summary']['issues_found'], 1)
+
+        validator.results['compatibility_issues'].append('second')
+        report = validator.generate_compatibility_report()
+        self.assertEqual(report['summary']['issues_found'], 2)
+        self.assertEqual(report['overall_assessment'], "Good - Minor compatibility issues detected")
+
+
+if __name__ == '__main__':
+    unittest.main()